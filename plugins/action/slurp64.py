@@ -11,12 +11,38 @@
 
 from __future__ import annotations
 
-from base64 import b64decode
+import binascii
 from typing import Any, Dict, Optional
 
 from ansible.errors import AnsibleActionFail
 from ansible_collections.o0_o.posix.plugins.action_utils import PosixBase
 
+try:
+    import pybase64
+
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
+
+
+def _b64decode_text(data: str) -> str:
+    """
+    Decode base64 data into UTF-8 text.
+
+    Uses the SIMD-accelerated ``pybase64`` decoder when it is
+    installed on the controller, otherwise the standard library
+    ``binascii`` decoder.
+
+    :param str data: Base64 encoded content
+    :returns str: The decoded UTF-8 text
+    :raises binascii.Error: When the data is not valid base64
+    :raises UnicodeDecodeError: When the decoded data is not UTF-8
+    """
+    if HAS_PYBASE64:
+        return pybase64.b64decode(data).decode("utf-8")
+
+    return binascii.a2b_base64(data).decode("utf-8")
+
 
 class ActionModule(PosixBase):
     """
@@ -29,7 +55,8 @@ class ActionModule(PosixBase):
 
     The plugin decodes base64 content returned by the slurp module
     and provides UTF-8 decoded content in the 'content' key, along
-    with 'content_lines' for convenient line-by-line access.
+    with 'content_lines' for convenient line-by-line access unless
+    'return_lines' is disabled.
 
     .. note::
        This plugin does not transfer files but requires a connection
@@ -75,6 +102,7 @@ class ActionModule(PosixBase):
         # Define the expected input parameters
         argument_spec = {
             "src": {"type": "str", "required": True},
+            "return_lines": {"type": "bool", "default": True},
             "_force_raw": {"type": "bool", "default": False},
         }
 
@@ -83,6 +111,7 @@ class ActionModule(PosixBase):
             argument_spec=argument_spec
         )
         src = new_module_args.get("src")
+        return_lines = new_module_args.get("return_lines")
         self.force_raw = new_module_args.pop("_force_raw")
 
         self._display.vvv(
@@ -98,7 +127,9 @@ class ActionModule(PosixBase):
         if self.force_raw:
             self._display.vvv("slurp64: forcing raw mode, calling _cat()")
             cat_result = self._cat(src, task_vars=task_vars)
-            self._display.vvv(f"slurp64: _cat() returned {cat_result}")
+            # Results carry the whole file; only format them when shown
+            if self._display.verbosity >= 3:
+                self._display.vvv(f"slurp64: _cat() returned {cat_result}")
             result.update(cat_result)
             result["raw"] = True
         else:
@@ -110,9 +141,10 @@ class ActionModule(PosixBase):
                     module_args={"src": src},
                     task_vars=task_vars,
                 )
-                self._display.vvv(
-                    f"slurp64: builtin slurp: {ansible_slurp_mod}"
-                )
+                if self._display.verbosity >= 3:
+                    self._display.vvv(
+                        f"slurp64: builtin slurp: {ansible_slurp_mod}"
+                    )
                 ansible_slurp_mod.pop("invocation")
                 result["raw"] = False
             except Exception as e:
@@ -135,9 +167,10 @@ class ActionModule(PosixBase):
                     "slurp64: falling back to _cat() due to interpreter error"
                 )
                 cat_result = self._cat(src, task_vars=task_vars)
-                self._display.vvv(
-                    f"slurp64: _cat() fallback returned {cat_result}"
-                )
+                if self._display.verbosity >= 3:
+                    self._display.vvv(
+                        f"slurp64: _cat() fallback returned {cat_result}"
+                    )
                 result.update(cat_result)
                 result["raw"] = True
             else:
@@ -145,9 +178,9 @@ class ActionModule(PosixBase):
                     self._display.vvv("slurp64: decoding slurp content")
                     try:
                         ansible_slurp_mod.pop("encoding", None)
-                        ansible_slurp_mod["content"] = b64decode(
+                        ansible_slurp_mod["content"] = _b64decode_text(
                             ansible_slurp_mod["content"]
-                        ).decode("utf-8")
+                        )
                         self._display.vvv("slurp64: decode succeeded")
                     except Exception as decode_error:
                         raise AnsibleActionFail(
@@ -162,7 +195,7 @@ class ActionModule(PosixBase):
 
                 result.update(ansible_slurp_mod)
 
-        if "content" in result:
+        if return_lines and "content" in result:
             result["content_lines"] = result["content"].splitlines()
             self._display.vvv(
                 f"slurp64: split content into {len(result['content_lines'])} "
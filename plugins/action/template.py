@@ -19,7 +19,8 @@ import os
 import shutil
 import stat
 import tempfile
-from typing import Any, Dict, Optional
+from collections import ChainMap, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from jinja2.defaults import (
     BLOCK_END_STRING,
@@ -74,6 +75,58 @@ else:
     trust_as_template = None
     _template_vars = None
 
+# Template-only options that must not be passed on to the copy action
+_TEMPLATE_ONLY_ARGS = frozenset(
+    (
+        "newline_sequence",
+        "block_start_string",
+        "block_end_string",
+        "variable_start_string",
+        "variable_end_string",
+        "comment_start_string",
+        "comment_end_string",
+        "trim_blocks",
+        "lstrip_blocks",
+        "_force_raw",
+    )
+)
+
+# File attribute options handed to _write_file in raw mode
+_PERM_ARGS = (
+    "owner",
+    "group",
+    "mode",
+    "selevel",
+    "serole",
+    "setype",
+    "seuser",
+)
+
+# Jinja2 syntax settings of the templar's own environment; overrides
+# equal to these are dropped so the environment is not overlaid
+_DEFAULT_OVERRIDES = {
+    "block_start_string": BLOCK_START_STRING,
+    "block_end_string": BLOCK_END_STRING,
+    "variable_start_string": VARIABLE_START_STRING,
+    "variable_end_string": VARIABLE_END_STRING,
+    "comment_start_string": COMMENT_START_STRING,
+    "comment_end_string": COMMENT_END_STRING,
+    "trim_blocks": True,
+    "lstrip_blocks": False,
+    "newline_sequence": "\n",
+}
+
+# Decoded template sources keyed by (path, size, mtime_ns) so repeated
+# renders of an unchanged file within this process skip the disk read;
+# kept in least-recently-used order and bounded to
+# _TEMPLATE_SOURCE_CACHE_SIZE entries. Each host and task runs in a
+# freshly forked worker, so this only hits for the items of a loop,
+# which TaskExecutor runs one after another in the same worker.
+_TEMPLATE_SOURCE_CACHE: "OrderedDict[Tuple[str, int, int], str]" = (
+    OrderedDict()
+)
+_TEMPLATE_SOURCE_CACHE_SIZE = 128
+
 
 class ActionModule(PosixBase):
     """
@@ -100,6 +153,11 @@ class ActionModule(PosixBase):
     _supports_async = False
     _supports_diff = True
 
+    # Merged argument spec, built on first use and kept on the class.
+    # Each host and task runs in a freshly forked worker, so it is only
+    # reused by the items of a loop within that worker.
+    _ARG_SPEC: Optional[Dict[str, Any]] = None
+
     def _def_args(self) -> Dict[str, Any]:
         """
         Define and parse module arguments using the file argument spec.
@@ -114,59 +172,242 @@ class ActionModule(PosixBase):
 
         .. note::
            This method removes the 'attributes' parameter from the file
-           argument spec as it's not supported by this plugin.
+           argument spec as it's not supported by this plugin. The
+           merged spec is cached on the class after the first call and
+           reused only by later items of the same loop.
         """
-        self._display.vvv("Defining argument spec")
-        argument_spec = get_file_arg_spec()
-        argument_spec.pop("attributes")
-        argument_spec.update(
-            {
-                "block_end_string": {
-                    "type": "str",
-                    "default": BLOCK_END_STRING,
-                },
-                "block_start_string": {
-                    "type": "str",
-                    "default": BLOCK_START_STRING,
-                },
-                "comment_end_string": {
-                    "type": "str",
-                    "default": COMMENT_END_STRING,
-                },
-                "comment_start_string": {
-                    "type": "str",
-                    "default": COMMENT_START_STRING,
-                },
-                "dest": {"type": "path", "required": True},
-                "force": {"type": "bool", "default": True},
-                "lstrip_blocks": {"type": "bool", "default": False},
-                "newline_sequence": {
-                    "type": "str",
-                    "choices": ["\n", "\r", "\r\n"],
-                    "default": "\n",
-                },
-                "src": {"type": "path", "required": True},
-                "trim_blocks": {"type": "bool", "default": True},
-                "backup": {"type": "bool", "default": False},
-                "validate": {"type": "str"},
-                "variable_end_string": {
-                    "type": "str",
-                    "default": VARIABLE_END_STRING,
-                },
-                "variable_start_string": {
-                    "type": "str",
-                    "default": VARIABLE_START_STRING,
-                },
-                "_force_raw": {"type": "bool", "default": False},
-            }
-        )
+        cls = type(self)
+        if cls._ARG_SPEC is None:
+            self._display.vvv("Defining argument spec")
+            argument_spec = get_file_arg_spec()
+            argument_spec.pop("attributes")
+            argument_spec.update(
+                {
+                    "block_end_string": {
+                        "type": "str",
+                        "default": BLOCK_END_STRING,
+                    },
+                    "block_start_string": {
+                        "type": "str",
+                        "default": BLOCK_START_STRING,
+                    },
+                    "comment_end_string": {
+                        "type": "str",
+                        "default": COMMENT_END_STRING,
+                    },
+                    "comment_start_string": {
+                        "type": "str",
+                        "default": COMMENT_START_STRING,
+                    },
+                    "dest": {"type": "path", "required": True},
+                    "force": {"type": "bool", "default": True},
+                    "lstrip_blocks": {"type": "bool", "default": False},
+                    "newline_sequence": {
+                        "type": "str",
+                        "choices": ["\n", "\r", "\r\n"],
+                        "default": "\n",
+                    },
+                    "src": {"type": "path", "required": True},
+                    "trim_blocks": {"type": "bool", "default": True},
+                    "backup": {"type": "bool", "default": False},
+                    "validate": {"type": "str"},
+                    "variable_end_string": {
+                        "type": "str",
+                        "default": VARIABLE_END_STRING,
+                    },
+                    "variable_start_string": {
+                        "type": "str",
+                        "default": VARIABLE_START_STRING,
+                    },
+                    "_force_raw": {"type": "bool", "default": False},
+                }
+            )
+            cls._ARG_SPEC = argument_spec
 
         validation_result, new_module_args = self.validate_argument_spec(
-            argument_spec=argument_spec,
+            argument_spec=dict(cls._ARG_SPEC),
         )
 
         return new_module_args
 
+    def _load_template_source(
+        self, resolved_src: str, st: os.stat_result
+    ) -> str:
+        """
+        Read and decode a template source file, memoized per process.
+
+        The decoded text is cached keyed on the path, size and
+        modification time of the file so that an unchanged template
+        is only read from disk once, while any edit to the file
+        invalidates the cached entry. As workers are forked per host
+        and task, the cache only helps the items of a loop within one
+        task.
+
+        :param str resolved_src: Local path of the resolved template
+        :param os.stat_result st: Stat result of ``resolved_src``
+        :returns str: The UTF-8 decoded template source
+        :raises AnsibleActionFail: When the template is not valid UTF-8
+        """
+        cache_key = (resolved_src, st.st_size, st.st_mtime_ns)
+        template_data = _TEMPLATE_SOURCE_CACHE.get(cache_key)
+        if template_data is not None:
+            self._display.vvv(f"Using cached template source {resolved_src}")
+            _TEMPLATE_SOURCE_CACHE.move_to_end(cache_key)
+            return template_data
+
+        if IS_ANSIBLE_2_19_PLUS:
+            # Ansible 2.19+ approach: use get_text_file_contents
+            template_data = self._loader.get_text_file_contents(resolved_src)
+        else:
+            # Ansible 2.15-2.18 approach: manual file loading
+            try:
+                tmp_source = self._loader.get_real_file(resolved_src)
+            except Exception:
+                # Fallback if get_real_file doesn't exist
+                tmp_source = resolved_src
+
+            b_tmp_source = to_bytes(tmp_source, errors="surrogate_or_strict")
+
+            try:
+                with open(b_tmp_source, "rb") as f:
+                    try:
+                        template_data = to_text(
+                            f.read(), errors="surrogate_or_strict"
+                        )
+                    except UnicodeError:
+                        raise AnsibleActionFail(
+                            "Template source files must be utf-8 encoded"
+                        )
+            finally:
+                # Clean up tmp file if it was created
+                if tmp_source != resolved_src:
+                    try:
+                        self._loader.cleanup_tmp_file(b_tmp_source)
+                    except Exception:
+                        pass  # Ignore cleanup errors
+
+        _TEMPLATE_SOURCE_CACHE[cache_key] = template_data
+        if len(_TEMPLATE_SOURCE_CACHE) > _TEMPLATE_SOURCE_CACHE_SIZE:
+            _TEMPLATE_SOURCE_CACHE.popitem(last=False)
+        return template_data
+
+    def _needs_render(
+        self, template_data: str, overrides: Dict[str, Any]
+    ) -> bool:
+        """
+        Check whether template data has to go through Jinja2 at all.
+
+        Source that contains none of the configured opening delimiters
+        and no ``#jinja2:`` override header renders to itself on
+        Ansible 2.19+. Before 2.19 every source went through the Jinja2
+        lexer, whose line ending translation and trailing newline
+        handling are only a no-op for ``\\n`` endings, so any other
+        endings are still rendered.
+
+        :param str template_data: The template source text
+        :param Dict[str, Any] overrides: The Jinja2 syntax overrides
+        :returns bool: True if the template must be rendered
+        """
+        if template_data.startswith("#jinja2:"):
+            return True
+
+        if not IS_ANSIBLE_2_19_PLUS and (
+            overrides["newline_sequence"] != "\n" or "\r" in template_data
+        ):
+            return True
+
+        return any(
+            overrides[key] in template_data
+            for key in (
+                "variable_start_string",
+                "block_start_string",
+                "comment_start_string",
+            )
+        )
+
+    def _render_template(
+        self,
+        template_data: str,
+        src: str,
+        resolved_src: str,
+        dest: str,
+        searchpath: List[str],
+        overrides: Dict[str, Any],
+        task_vars: Dict[str, Any],
+    ) -> str:
+        """
+        Render template data with Jinja2 on the controller.
+
+        :param str template_data: The template source text
+        :param str src: The src path as given to the task
+        :param str resolved_src: Local path of the resolved template
+        :param str dest: The destination path on the remote host
+        :param List[str] searchpath: Paths searched for includes
+        :param Dict[str, Any] overrides: The Jinja2 syntax overrides
+        :param Dict[str, Any] task_vars: Task variables dictionary
+        :returns str: The rendered template text
+        """
+        # Only hand the templar the settings that differ from its
+        # defaults; any override makes it overlay a new environment
+        changed_overrides = {
+            key: value
+            for key, value in overrides.items()
+            if value != _DEFAULT_OVERRIDES[key]
+        }
+
+        # Process template using version-specific approach. Overlay the
+        # generated template vars on task_vars with a ChainMap instead
+        # of cloning the (potentially very large) task_vars dict.
+        if IS_ANSIBLE_2_19_PLUS:
+            # Ansible 2.19+ approach
+            template_data = trust_as_template(template_data)
+            temp_vars = ChainMap(
+                _template_vars.generate_ansible_template_vars(
+                    path=src,
+                    fullpath=resolved_src,
+                    dest_path=dest,
+                    include_ansible_managed="ansible_managed" not in task_vars,
+                ),
+                task_vars,
+            )
+
+            # Create templar and process template
+            data_templar = self._templar.copy_with_new_env(
+                searchpath=searchpath, available_variables=temp_vars
+            )
+            resultant = data_templar.template(
+                template_data,
+                escape_backslashes=False,
+                overrides=changed_overrides or None,
+            )
+        else:
+            # Ansible 2.15-2.18 approach
+            temp_vars = ChainMap(
+                generate_ansible_template_vars(src, resolved_src, dest),
+                task_vars,
+            )
+
+            # Create templar with AnsibleEnvironment
+            templar = self._templar.copy_with_new_env(
+                environment_class=AnsibleEnvironment,
+                searchpath=searchpath,
+                newline_sequence=overrides["newline_sequence"],
+                available_variables=temp_vars,
+            )
+
+            # Use do_template for Ansible 2.15 compatibility
+            resultant = templar.do_template(
+                template_data,
+                preserve_trailing_newlines=True,
+                escape_backslashes=False,
+                overrides=changed_overrides or None,
+            )
+
+        if resultant is None:
+            resultant = ""
+
+        return resultant
+
     def run(
         self,
         tmp: Optional[str] = None,
@@ -239,54 +480,46 @@ class ActionModule(PosixBase):
         except AnsibleError as e:
             raise AnsibleActionFail(to_text(e))
 
+        # In raw mode an existing dest with force disabled is left
+        # alone, so check for it before spending any time rendering
+        dest_stat = None
+        if self.force_raw and not force:
+            dest_stat = self._pseudo_stat(dest, task_vars=task_vars)
+            if dest_stat["exists"]:
+                self._display.vvv("Destination exists, skipping render")
+                self.result["msg"] = (
+                    "File exists and force is disabled, taking no action"
+                )
+                self.result["raw"] = True
+                self._remove_tmp_path(self._connection._shell.tmpdir)
+                return self.result
+
+        # Stat the source once for both mode preservation and the
+        # template source cache key
+        src_stat = os.stat(resolved_src)
+
         # Preserve mode if requested
         mode = new_module_args.get("mode")
         if mode == "preserve":
-            mode = "0%03o" % stat.S_IMODE(os.stat(resolved_src).st_mode)
-
-        # Template the source data locally - version-specific loading
-        if IS_ANSIBLE_2_19_PLUS:
-            # Ansible 2.19+ approach: use get_text_file_contents with
-            # trust_as_template
-            template_data = trust_as_template(
-                self._loader.get_text_file_contents(resolved_src)
-            )
-        else:
-            # Ansible 2.15-2.18 approach: manual file loading
-            try:
-                tmp_source = self._loader.get_real_file(resolved_src)
-            except Exception:
-                # Fallback if get_real_file doesn't exist
-                tmp_source = resolved_src
-
-            b_tmp_source = to_bytes(tmp_source, errors="surrogate_or_strict")
-
-            try:
-                with open(b_tmp_source, "rb") as f:
-                    try:
-                        template_data = to_text(
-                            f.read(), errors="surrogate_or_strict"
-                        )
-                    except UnicodeError:
-                        raise AnsibleActionFail(
-                            "Template source files must be utf-8 encoded"
-                        )
-            finally:
-                # Clean up tmp file if it was created
-                if tmp_source != resolved_src:
-                    try:
-                        self._loader.cleanup_tmp_file(b_tmp_source)
-                    except Exception:
-                        pass  # Ignore cleanup errors
-
-        # Set up searchpath for both versions
-        searchpath = task_vars.get("ansible_search_path", [])
-        searchpath.extend(
-            [self._loader._basedir, os.path.dirname(resolved_src)]
-        )
+            mode = "0%03o" % stat.S_IMODE(src_stat.st_mode)
+
+        # Load the template source data locally
+        template_data = self._load_template_source(resolved_src, src_stat)
+
+        # Set up searchpath for both versions; build a new list so the
+        # caller's ansible_search_path is never extended in place. Like
+        # ansible.builtin.template, each path's 'templates' subdir is
+        # searched right before the path itself.
+        base_paths = [
+            *task_vars.get("ansible_search_path", ()),
+            self._loader._basedir,
+            os.path.dirname(resolved_src),
+        ]
         searchpath = [
-            os.path.join(p, "templates") for p in searchpath
-        ] + searchpath
+            search_path
+            for p in base_paths
+            for search_path in (os.path.join(p, "templates"), p)
+        ]
 
         # Create common overrides for both versions
         overrides = {
@@ -301,85 +534,54 @@ class ActionModule(PosixBase):
             "newline_sequence": newline_sequence,
         }
 
-        # Process template using version-specific approach
-        temp_vars = task_vars.copy()
-
-        if IS_ANSIBLE_2_19_PLUS:
-            # Ansible 2.19+ approach
-            temp_vars.update(
-                _template_vars.generate_ansible_template_vars(
-                    path=src,
-                    fullpath=resolved_src,
-                    dest_path=dest,
-                    include_ansible_managed="ansible_managed" not in temp_vars,
-                )
-            )
-
-            # Create templar and process template
-            data_templar = self._templar.copy_with_new_env(
-                searchpath=searchpath, available_variables=temp_vars
-            )
-            resultant = data_templar.template(
-                template_data, escape_backslashes=False, overrides=overrides
-            )
-        else:
-            # Ansible 2.15-2.18 approach
-            temp_vars.update(
-                generate_ansible_template_vars(src, resolved_src, dest)
-            )
-
-            # Create templar with AnsibleEnvironment
-            templar = self._templar.copy_with_new_env(
-                environment_class=AnsibleEnvironment,
-                searchpath=searchpath,
-                newline_sequence=newline_sequence,
-                available_variables=temp_vars,
-            )
-
-            # Use do_template for Ansible 2.15 compatibility
-            resultant = templar.do_template(
+        if self._needs_render(template_data, overrides):
+            result_text = self._render_template(
                 template_data,
-                preserve_trailing_newlines=True,
-                escape_backslashes=False,
+                src=src,
+                resolved_src=resolved_src,
+                dest=dest,
+                searchpath=searchpath,
                 overrides=overrides,
+                task_vars=task_vars,
             )
+        else:
+            self._display.vvv("No Jinja2 syntax in template, skipping render")
+            result_text = template_data
 
-        if resultant is None:
-            resultant = ""
-
-        result_text = resultant
-
-        # Create temp file
-        local_tempdir = tempfile.mkdtemp(dir=C.DEFAULT_LOCAL_TMP)
-        result_file = os.path.join(
-            local_tempdir, os.path.basename(resolved_src)
-        )
-        with open(to_bytes(result_file), "wb") as f:
-            f.write(to_bytes(result_text, encoding="utf-8"))
-
+        # The rendered text only needs to hit local disk when it is
+        # handed to the copy action; raw mode writes it to the remote
+        # directly
+        local_tempdir = None
         try:
             if not self.force_raw:
+                local_tempdir = tempfile.mkdtemp(dir=C.DEFAULT_LOCAL_TMP)
+                result_file = os.path.join(
+                    local_tempdir, os.path.basename(resolved_src)
+                )
+                # Let the text layer encode through its own buffer
+                # rather than building a second, fully encoded copy of
+                # the output
+                with open(
+                    to_bytes(result_file),
+                    "w",
+                    encoding="utf-8",
+                    errors="surrogateescape",
+                    newline="",
+                ) as f:
+                    f.write(result_text)
+
                 self._display.vvv("Attempt native execution to detect Python")
                 new_task = self._task.copy()
+                new_task.args = {
+                    key: value
+                    for key, value in new_task.args.items()
+                    if key not in _TEMPLATE_ONLY_ARGS
+                }
                 new_task.args["src"] = result_file
                 new_task.args["dest"] = dest
                 new_task.args["follow"] = True
                 new_task.args["mode"] = mode
 
-                for remove in (
-                    "newline_sequence",
-                    "block_start_string",
-                    "block_end_string",
-                    "variable_start_string",
-                    "variable_end_string",
-                    "comment_start_string",
-                    "comment_end_string",
-                    "trim_blocks",
-                    "lstrip_blocks",
-                    "_force_raw",
-                ):
-                    new_task.args.pop(remove, None)
-
                 copy_action = self._shared_loader_obj.action_loader.get(
                     "ansible.legacy.copy",
                     task=new_task,
@@ -411,20 +613,13 @@ class ActionModule(PosixBase):
                     self._mk_dest_dir(dest, task_vars=task_vars)
 
                     self._display.vvv(f"Writing rendered template to {dest}")
-                    perms = {
-                        key: new_module_args[key]
-                        for key in (
-                            "owner",
-                            "group",
-                            "mode",
-                            "selevel",
-                            "serole",
-                            "setype",
-                            "seuser",
-                        )
-                    }
+                    perms = {key: new_module_args[key] for key in _PERM_ARGS}
+                    # Hand over the resolved octal mode, not "preserve"
+                    perms["mode"] = mode
 
-                    if not force:
+                    # Only stat dest when the early check above did not
+                    # run, i.e. after falling back to raw mode
+                    if not force and dest_stat is None:
                         dest_stat = self._pseudo_stat(
                             dest, task_vars=task_vars
                         )
@@ -463,10 +658,15 @@ class ActionModule(PosixBase):
                         }
                     )
         finally:
-            # Clean up temporary files
-            shutil.rmtree(
-                to_bytes(local_tempdir, errors="surrogate_or_strict")
-            )
+            # Clean up temporary files; the directory only ever holds
+            # the rendered file, so unlink it directly and only walk
+            # the tree if something unexpected was left behind
+            if local_tempdir is not None:
+                try:
+                    os.unlink(result_file)
+                    os.rmdir(local_tempdir)
+                except OSError:
+                    shutil.rmtree(local_tempdir, ignore_errors=True)
             self._remove_tmp_path(self._connection._shell.tmpdir)
 
         return self.result
@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import difflib
 import hashlib
+import re
 import shlex
 import stat
 from datetime import datetime, timezone
@@ -33,6 +34,97 @@ from ansible.errors import AnsibleActionFail
 from ansible.module_utils.common.text.converters import to_text
 from ansible.plugins.action import ActionBase
 
+# Message Ansible reports when the remote interpreter cannot be run,
+# matched case-insensitively without lowercasing the whole message
+_INTERPRETER_MISSING_RE = re.compile(
+    re.escape(
+        "The module failed to execute correctly, you probably need to set "
+        "the interpreter"
+    ),
+    re.IGNORECASE,
+)
+
+# Probes existence, symlink status and type of the path in "$1" with
+# POSIX test(1) in a single remote command. Prints "missing", or the
+# symlink flag and the first matching type flag, e.g. "0 d". When "$2"
+# holds ls options, the ls line for the path follows on a second line.
+# When "$3" is non-empty and the path is a regular file, its SHA-256
+# digest follows on the last line, empty if no sha256 tool is found.
+_PSEUDO_STAT_SCRIPT = (
+    'if [ ! -e "$1" ]; then echo missing; exit 0; fi; '
+    'if [ -L "$1" ]; then l=1; else l=0; fi; '
+    "t=?; for f in d f b c p S; do "
+    'if [ -"$f" "$1" ]; then t=$f; break; fi; '
+    "done; "
+    'echo "$l $t"; '
+    'if [ -n "$2" ]; then ls "$2" "$1" || exit; fi; '
+    'if [ -n "$3" ] && [ "$t" = f ]; then '
+    'h=$( (sha256sum "$1" || shasum -a 256 "$1" || sha256 -q "$1") '
+    "2>/dev/null); "
+    'echo "${h%% *}"; fi'
+)
+
+# Resolves every binary named in "$@" the way _which does, printing
+# one "name<TAB>location" line each with an empty location if missing
+_WHICH_MANY_SCRIPT = (
+    'for b in "$@"; do '
+    'if p=$(command -v "$b" 2>/dev/null) && [ -n "$p" ]; then :; '
+    'elif p=$(which "$b" 2>/dev/null) && [ -n "$p" ]; then :; '
+    "else p=; fi; "
+    'printf \'%s\\t%s\\n\' "$b" "$p"; '
+    "done"
+)
+
+# Registers the SELinux type "$1" for the path "$2" and applies it in
+# a single remote command; the exit status tells which step failed
+_SELINUX_FCONTEXT_SCRIPT = (
+    'semanage fcontext -a -t "$1" "$2" || exit 3; restorecon "$2" || exit 4'
+)
+_SELINUX_RESTORECON_FAILED_RC = 4
+
+# Sets the owner "$1", group "$2" and mode "$3" of the path "$4" in a
+# single remote command, skipping empty values. When "$6" is non-empty
+# the path is then moved there. The final path is listed with ls -ld
+# when "$5" is non-empty. The exit status tells which step failed.
+_APPLY_PERMS_SCRIPT = (
+    'if [ -n "$1" ]; then chown "$1" "$4" || exit 3; fi; '
+    'if [ -n "$2" ]; then chgrp "$2" "$4" || exit 4; fi; '
+    'if [ -n "$3" ]; then chmod "$3" "$4" || exit 5; fi; '
+    'p=$4; if [ -n "$6" ]; then mv "$4" "$6" || exit 7; p=$6; fi; '
+    'if [ -n "$5" ]; then ls -ld "$p" || exit 6; fi'
+)
+_APPLY_PERMS_FAILED_STEPS = {3: "chown", 4: "chgrp", 5: "chmod"}
+_APPLY_PERMS_MOVE_FAILED_RC = 7
+
+# Writes stdin to the new file "$1" with only owner access and makes
+# sure an existing file ends up 0600 too; the exit status tells which
+# step failed
+_WRITE_TEMP_FILE_SCRIPT = (
+    'umask 077; cat > "$1" || exit 3; chmod 0600 "$1" || exit 4'
+)
+_WRITE_TEMP_FILE_CHMOD_FAILED_RC = 4
+
+# Permission keys compared verbatim against the parsed ls output; mode
+# is compared separately after converting it to symbolic form
+_PERM_COMPARE_KEYS = (
+    "owner",
+    "group",
+    "selevel",
+    "serole",
+    "setype",
+    "seuser",
+)
+
+# test(1) type flags printed by _PSEUDO_STAT_SCRIPT
+_PSEUDO_STAT_TYPES = {
+    "d": "directory",
+    "f": "file",
+    "b": "block",
+    "c": "char",
+    "p": "pipe",
+    "S": "socket",
+}
+
 
 class PosixBase(ActionBase):
     """
@@ -51,9 +143,15 @@ class PosixBase(ActionBase):
 
     This base is intended for use in collections targeting POSIX
     systems.
-    All operations rely exclusively on POSIX-standard tools such as
-    `cat`, `mv`, `cp`, `mkdir`, `chown`, `chmod`, and `printf`. Non-
-    portable utilities like `install` are deliberately avoided.
+    Operations rely on POSIX-standard tools such as `cat`, `mv`, `cp`,
+    `mkdir`, `chown`, `chmod`, and `printf`. Non-portable utilities
+    like `install` are deliberately avoided and never required.
+
+    The one optional, non-POSIX probe is the SHA-256 digest that
+    ``_pseudo_stat`` computes with `sha256sum`, `shasum`, or `sha256`
+    when the remote host has one of them. When none is present the
+    digest is None and ``_compare_content_and_perms`` falls back to
+    slurping the whole file to compare its content.
 
     Usage:
         class ActionModule(PosixBase):
@@ -61,6 +159,22 @@ class PosixBase(ActionBase):
                 ...
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Set up the per-task state shared by the helpers.
+
+        Accepts the same arguments as ``ActionBase``.
+        """
+        super().__init__(*args, **kwargs)
+
+        # The calling task's action never changes, so normalize it once
+        # for the recursion check in _run_action
+        self._current_fqcn = self._task.action.lower().strip()
+
+        # Binary locations resolved by _which and _which_many, since
+        # they do not change during a task
+        self._which_cache: Dict[str, Optional[str]] = {}
+
     def run(
         self,
         tmp: Optional[str] = None,
@@ -101,12 +215,7 @@ class PosixBase(ActionBase):
         if not isinstance(msg, str):
             return False
 
-        canary_str = (
-            "The module failed to execute correctly, you probably need to set "
-            "the interpreter"
-        )
-
-        if canary_str.lower() in msg.lower():
+        if _INTERPRETER_MISSING_RE.search(msg):
             self.force_raw = True
             self._display.vv("Python not found, proceeding with raw commands")
             return True
@@ -133,10 +242,9 @@ class PosixBase(ActionBase):
         :returns dict: The result dictionary returned by the plugin's
             run method
         """
-        current_fqcn = self._task.action.lower().strip()
         requested_fqcn = plugin_name.lower().strip()
 
-        if requested_fqcn == current_fqcn:
+        if requested_fqcn == self._current_fqcn:
             raise AnsibleActionFail(
                 f"CompatAction attempted to call '{plugin_name}' from within "
                 "itself. This would result in infinite recursion."
@@ -274,63 +382,98 @@ class PosixBase(ActionBase):
         return {k: v for k, v in args.items() if v is not None}
 
     def _pseudo_stat(
-        self, target_path: str, task_vars: Optional[Dict[str, Any]] = None
+        self,
+        target_path: str,
+        task_vars: Optional[Dict[str, Any]] = None,
+        get_perms: bool = False,
+        selinux: bool = False,
+        checksum: bool = False,
     ) -> Dict[str, Any]:
         """
         Fallback-compatible file stat using POSIX ``test`` commands.
 
-        This method uses a combination of ``test`` shell commands to
-        detect if a remote path exists, what type of object it is (e.g.,
-        file, directory, etc.), and whether it is a symlink.
+        This method runs a short ``sh`` script of ``test`` commands in
+        a single remote call to detect if a remote path exists, what
+        type of object it is (e.g., file, directory, etc.), and whether
+        it is a symlink.
 
         :param str target_path: The remote path to test
         :param Optional[dict] task_vars: Ansible task_vars from run(),
             passed to _cmd()
+        :param bool get_perms: Whether to also list the permissions of
+            an existing path in the same remote call
+        :param bool selinux: Whether the listed permissions should
+            include the SELinux context
+        :param bool checksum: Whether to also compute the SHA-256
+            digest of a regular file in the same remote call
         :returns dict: Dictionary with keys 'exists' (bool), 'type'
-            (str or None), 'is_symlink' (bool), 'raw' (bool)
+            (str or None), 'is_symlink' (bool), 'raw' (bool),
+            'perms' (dict, as returned by ``_get_perms``) when
+            ``get_perms`` is set and the path exists, and 'checksum'
+            (str or None) when ``checksum`` is set and the path is a
+            regular file
         :raises AnsibleActionFail: if type cannot be determined
         """
-        exists_test = self._cmd(
-            ["test", "-e", target_path], task_vars=task_vars, check_mode=False
+        ls_opts = ""
+        if get_perms:
+            ls_opts = "-Zd" if selinux else "-ld"
+
+        stat_cmd = ["sh", "-c", _PSEUDO_STAT_SCRIPT, "sh", target_path]
+        if get_perms or checksum:
+            stat_cmd.append(ls_opts)
+        if checksum:
+            stat_cmd.append("1")
+
+        stat_result = self._cmd(
+            stat_cmd, task_vars=task_vars, check_mode=False
         )
 
-        result = {"raw": exists_test.get("raw", False)}
+        result = {"raw": stat_result.get("raw", False)}
 
-        if exists_test["rc"] != 0:
+        stdout_lines = (stat_result.get("stdout") or "").splitlines()
+        fields = stdout_lines[0].split() if stdout_lines else []
+        if stat_result["rc"] != 0 or not fields:
+            raise AnsibleActionFail(
+                f"Unable to stat '{target_path}': "
+                f"{(stat_result.get('stderr') or '').strip()}"
+            )
+
+        if fields == ["missing"]:
             result["exists"] = False
             result["type"] = None
             return result
 
         result["exists"] = True
+        result["is_symlink"] = fields[0] == "1"
 
-        symlink_test = self._cmd(
-            ["test", "-L", target_path], task_vars=task_vars, check_mode=False
-        )
+        type_name = _PSEUDO_STAT_TYPES.get(fields[-1])
+        if type_name is None:
+            raise AnsibleActionFail(
+                f"All POSIX 'test' commands failed on '{target_path}'"
+            )
 
-        result["is_symlink"] = symlink_test["rc"] == 0
+        result["type"] = type_name
 
-        type_tests = [
-            ("directory", ["-d"]),
-            ("file", ["-f"]),
-            ("block", ["-b"]),
-            ("char", ["-c"]),
-            ("pipe", ["-p"]),
-            ("socket", ["-S"]),
-        ]
+        if get_perms:
+            if len(stdout_lines) < 2:
+                raise AnsibleActionFail(
+                    f"Could not stat {target_path}: "
+                    f"{(stat_result.get('stderr') or '').strip()}"
+                )
+            result["perms"] = self._parse_perms(
+                stdout_lines[1], selinux=selinux
+            )
 
-        for type_name, flag in type_tests:
-            check = self._cmd(
-                ["test"] + flag + [target_path],
-                task_vars=task_vars,
-                check_mode=False,
+        if checksum and type_name == "file":
+            expected = 3 if get_perms else 2
+            digest = (
+                stdout_lines[-1].strip()
+                if len(stdout_lines) >= expected
+                else ""
             )
-            if check["rc"] == 0:
-                result["type"] = type_name
-                return result
+            result["checksum"] = digest or None
 
-        raise AnsibleActionFail(
-            f"All POSIX 'test' commands failed on '{target_path}'"
-        )
+        return result
 
     def _mkdir(
         self,
@@ -338,6 +481,7 @@ class PosixBase(ActionBase):
         task_vars: Optional[Dict[str, Any]] = None,
         parents: Optional[bool] = True,
         mode: Optional[str] = None,
+        target_stat: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
         Ensure a directory exists on the remote host.
@@ -352,13 +496,18 @@ class PosixBase(ActionBase):
             (``mkdir -p``)
         :param Optional[str] mode: Optional permission mode string
             (e.g. "0755")
+        :param Optional[dict] target_stat: A ``_pseudo_stat`` result
+            for ``target_path`` the caller already has, to avoid
+            statting it again
         :returns dict: Dictionary with ``changed`` boolean key
         :raises AnsibleActionFail: On directory creation error
         """
         self._display.vvv(f"Creating directory: {target_path}")
 
         # Check if the path exists
-        stat = self._pseudo_stat(target_path, task_vars=task_vars)
+        stat = target_stat or self._pseudo_stat(
+            target_path, task_vars=task_vars
+        )
         if stat["type"] == "directory":
             self._display.vvv(f"Directory already exists: {target_path}")
             return {"rc": 0, "changed": False}
@@ -403,12 +552,17 @@ class PosixBase(ActionBase):
         """
         Generate an Ansible-style backup file name based on the path.
 
-        The format is: ``<path>.<md5_digest>.<UTC timestamp>``
+        The format is: ``<path>.<digest>.<UTC timestamp>``, where the
+        digest is a 128-bit BLAKE2b hash of the path. It only tags the
+        name, so BLAKE2b is used rather than MD5, which is both slower
+        and unavailable on FIPS-enabled controllers.
 
         :param str target_path: The full remote file path to back up
         :returns str: Backup file name as a string
         """
-        digest = hashlib.md5(target_path.encode("utf-8")).hexdigest()
+        digest = hashlib.blake2b(
+            target_path.encode("utf-8"), digest_size=16
+        ).hexdigest()
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
         return f"{target_path}.{digest}.{timestamp}"
 
@@ -425,12 +579,18 @@ class PosixBase(ActionBase):
         :param str validate_cmd: The validation command template
         :param Optional[dict] task_vars: Task vars from the calling
             action
-        :raises AnsibleActionFail: If validation fails
+        :raises AnsibleActionFail: If the command has no ``%s``
+            placeholder or validation fails
         """
-        self._display.vvv(f"Validating {tmpfile}")
         if not validate_cmd:
             return
 
+        if "%s" not in validate_cmd:
+            raise AnsibleActionFail(
+                f"validate must contain %s: {validate_cmd}"
+            )
+
+        self._display.vvv(f"Validating {tmpfile}")
         cmd = validate_cmd % self._quote(tmpfile)
         result = self._cmd(cmd, task_vars=task_vars)
 
@@ -441,7 +601,10 @@ class PosixBase(ActionBase):
             )
 
     def _create_backup(
-        self, dest: str, task_vars: Optional[Dict[str, Any]] = None
+        self,
+        dest: str,
+        task_vars: Optional[Dict[str, Any]] = None,
+        dest_exists: Optional[bool] = None,
     ) -> Optional[str]:
         """
         Create a backup of the destination file if it exists.
@@ -449,12 +612,16 @@ class PosixBase(ActionBase):
         :param str dest: Destination file to back up
         :param Optional[dict] task_vars: Task vars from the calling
             action
+        :param Optional[bool] dest_exists: Whether ``dest`` is already
+            known to exist; checked on the remote host when None
         :returns Optional[str]: Path to the backup file or None if not
             created
         :raises AnsibleActionFail: If backup fails
         """
-        result = self._cmd(["test", "-e", dest], task_vars=task_vars)
-        if result["rc"] != 0:
+        if dest_exists is None:
+            result = self._cmd(["test", "-e", dest], task_vars=task_vars)
+            dest_exists = result["rc"] == 0
+        if not dest_exists:
             return None
 
         backup_path = self._generate_ansible_backup_path(dest)
@@ -512,27 +679,18 @@ class PosixBase(ActionBase):
         restorecon_path = self._which("restorecon", task_vars=task_vars)
 
         if semanage_path and restorecon_path and setype:
-            fcontext_type = setype
-            semanage_cmd = [
-                "semanage",
-                "fcontext",
-                "-a",
-                "-t",
-                fcontext_type,
-                dest,
-            ]
-            result = self._cmd(semanage_cmd, task_vars=task_vars)
-            if result["rc"] != 0:
+            result = self._cmd(
+                ["sh", "-c", _SELINUX_FCONTEXT_SCRIPT, "sh", setype, dest],
+                task_vars=task_vars,
+            )
+            if result["rc"] == _SELINUX_RESTORECON_FAILED_RC:
                 raise AnsibleActionFail(
-                    "Failed to register SELinux context with semanage: "
+                    "Failed to apply SELinux context with restorecon: "
                     f"{result.get('stderr', '')}"
                 )
-
-            restorecon_cmd = ["restorecon", dest]
-            result = self._cmd(restorecon_cmd, task_vars=task_vars)
             if result["rc"] != 0:
                 raise AnsibleActionFail(
-                    "Failed to apply SELinux context with restorecon: "
+                    "Failed to register SELinux context with semanage: "
                     f"{result.get('stderr', '')}"
                 )
             return
@@ -573,34 +731,113 @@ class PosixBase(ActionBase):
             to the ``_cmd`` method
         :returns Optional[str]: Path to the binary or the name if it's
             a shell builtin
+
+        .. note::
+           Results are cached on the instance, since binary locations
+           do not change during a task.
         """
-        # POSIX-compliant check first
-        cmd_result = self._cmd(
-            ["sh", "-c", f"command -v {binary}"], task_vars=task_vars
-        )
-        stdout = cmd_result.get("stdout", "").strip()
-
-        if cmd_result["rc"] == 0 and stdout:
-            # If stdout is just the binary name (no slash), assume
-            # builtin
-            if "/" not in stdout:
-                return binary
-            return stdout
-
-        # Fallback to 'which' if available
-        cmd_result = self._cmd(["which", binary], task_vars=task_vars)
-        stdout = cmd_result.get("stdout", "").strip().lower()
-
-        if cmd_result["rc"] == 0 and stdout:
-            # Detect builtin shell descriptions from common formats
-            if "shell built-in command" in stdout or "shell builtin" in stdout:
-                return binary
-            if stdout and "/" not in stdout:
-                return binary
-            return stdout
+        which_cache = self._which_cache
+
+        if binary not in which_cache:
+            which_cache[binary] = self._locate_binary(
+                binary, task_vars=task_vars
+            )
+
+        return which_cache[binary]
+
+    def _which_many(
+        self,
+        binaries: Tuple[str, ...],
+        task_vars: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Locate several binaries with a single remote command.
+
+        Resolves every binary not already in the ``_which`` cache in
+        one ``sh`` invocation and stores the results in the cache, so
+        subsequent ``_which`` calls for them do not touch the remote
+        host.
+
+        :param Tuple[str, ...] binaries: Names of the binaries to
+            locate
+        :param Optional[dict] task_vars: Ansible task variables passed
+            to the ``_cmd`` method
+        :returns Dict[str, Optional[str]]: Mapping of each binary to
+            its path, its name if it's a shell builtin, or None
+        """
+        which_cache = self._which_cache
+
+        pending = [b for b in binaries if b not in which_cache]
+        if pending:
+            cmd_result = self._cmd(
+                ["sh", "-c", _WHICH_MANY_SCRIPT, "sh", *pending],
+                task_vars=task_vars,
+            )
+            if cmd_result["rc"] == 0:
+                for line in (cmd_result.get("stdout") or "").splitlines():
+                    name, _, location = line.rstrip("\r").partition("\t")
+                    if name not in pending:
+                        continue
+                    which_cache[name] = self._classify_binary_location(
+                        name, location
+                    )
+
+        # Anything the batch could not answer is resolved one by one
+        return {b: self._which(b, task_vars=task_vars) for b in binaries}
+
+    def _locate_binary(
+        self, binary: str, task_vars: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Resolve a binary on the remote host, bypassing the cache.
+
+        :param str binary: The name of the binary to locate
+        :param Optional[dict] task_vars: Ansible task variables passed
+            to the ``_cmd`` method
+        :returns Optional[str]: Path to the binary or the name if it's
+            a shell builtin
+        """
+        # POSIX-compliant check first, then fall back to 'which'
+        for probe in (["sh", "-c", f"command -v {binary}"], ["which", binary]):
+            cmd_result = self._cmd(probe, task_vars=task_vars)
+            if cmd_result["rc"] != 0:
+                continue
+            location = self._classify_binary_location(
+                binary, cmd_result.get("stdout", "")
+            )
+            if location is not None:
+                return location
 
         return None
 
+    def _classify_binary_location(
+        self, binary: str, location: str
+    ) -> Optional[str]:
+        """
+        Interpret what ``command -v`` or ``which`` printed for a binary.
+
+        :param str binary: The name of the binary that was looked up
+        :param str location: The lookup output for the binary
+        :returns Optional[str]: The path to the binary, its name if
+            it's a shell builtin or function, or None if the output is
+            empty
+        """
+        location = location.strip()
+        if not location:
+            return None
+
+        # Builtins and functions print a bare name or, for some
+        # 'which' implementations, a description instead of a path
+        lowered = location.lower()
+        if (
+            "/" not in location
+            or "shell built-in command" in lowered
+            or "shell builtin" in lowered
+        ):
+            return binary
+
+        return location
+
     def _get_perms(
         self,
         target: str,
@@ -644,7 +881,23 @@ class PosixBase(ActionBase):
                 f"Could not stat {target}: {cmd_result['stderr']}"
             )
 
-        parts = cmd_result["stdout_lines"][0].split()
+        return self._parse_perms(
+            cmd_result["stdout_lines"][0], selinux=selinux
+        )
+
+    def _parse_perms(
+        self, ls_line: str, selinux: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Parse the permissions of a path from ``ls -ld`` or ``ls -Zd``.
+
+        :param str ls_line: Line printed by ``ls`` for the path
+        :param bool selinux: Whether the line is from ``ls -Zd``
+        :returns dict: Dictionary of permissions as returned by
+            ``_get_perms``
+        :raises AnsibleActionFail: If the SELinux output is malformed
+        """
+        parts = ls_line.split()
 
         if selinux:
             try:
@@ -656,8 +909,7 @@ class PosixBase(ActionBase):
                 seuser, serole, setype, selevel = context.split(":")
             except Exception:
                 raise AnsibleActionFail(
-                    "Unexpected SELinux output from ls -Zd: "
-                    f"{cmd_result['stdout']}"
+                    f"Unexpected SELinux output from ls -Zd: {ls_line}"
                 )
 
             return {
@@ -713,7 +965,10 @@ class PosixBase(ActionBase):
             raise AnsibleActionFail(
                 "_write_file() requires a string or list of strings"
             )
-        self._display.vvv(f"Normalized lines: {lines}")
+        # Formatting every line is costly for large files, so only do it
+        # when the message will actually be displayed
+        if self._display.verbosity >= 3:
+            self._display.vvv(f"Normalized lines: {lines}")
         return lines, normalized
 
     def _write_temp_file(
@@ -723,37 +978,34 @@ class PosixBase(ActionBase):
         task_vars: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """
-        Write lines to a remote temp file using ``tee`` and stdin.
+        Write lines to a remote temp file using ``cat`` and stdin.
 
-        Writes content to a temporary file on the remote host, then
-        applies ``chmod 0600`` for security.
+        Writes content to a temporary file on the remote host with
+        mode ``0600`` in a single remote command. Unlike ``tee``,
+        ``cat`` does not echo the content back over the connection.
 
         :param List[str] lines: Content lines to write
         :param str tmpfile: Temporary file path on remote host
         :param Optional[dict] task_vars: Ansible task variables
-        :returns dict: Result from the ``tee`` command
+        :returns dict: Result from the write command
         :raises AnsibleActionFail: If writing or chmod fails
         """
         self._display.vvv(f"Writing to temp file: {tmpfile}")
         lines_str = "\n".join(lines)
         write_result = self._cmd(
-            cmd=["tee", tmpfile],
+            cmd=["sh", "-c", _WRITE_TEMP_FILE_SCRIPT, "sh", tmpfile],
             stdin=lines_str,
             task_vars=task_vars,
         )
-        if write_result.get("rc", 1) != 0:
+        rc = write_result.get("rc", 1)
+        if rc == _WRITE_TEMP_FILE_CHMOD_FAILED_RC:
             raise AnsibleActionFail(
-                f"Failed to write temp file {tmpfile}: "
-                f"{write_result.get('stderr', '')}"
+                f"Failed to chmod temp file: {write_result.get('stderr', '')}"
             )
-
-        self._display.vvv(f"Setting temp file permissions: {tmpfile}")
-        chmod_result = self._cmd(
-            ["chmod", "0600", tmpfile], task_vars=task_vars
-        )
-        if chmod_result.get("rc", 1) != 0:
+        if rc != 0:
             raise AnsibleActionFail(
-                f"Failed to chmod temp file: {chmod_result.get('stderr', '')}"
+                f"Failed to write temp file {tmpfile}: "
+                f"{write_result.get('stderr', '')}"
             )
         return write_result
 
@@ -779,6 +1031,11 @@ class PosixBase(ActionBase):
             self._display.vvv("No SELinux tools found")
             return False
 
+        # Resolve every tool _handle_selinux_context may need in one
+        # remote call; the _which lookups below and there hit the cache
+        self._which_many(
+            ("chcon", "semanage", "restorecon"), task_vars=task_vars
+        )
         chcon_path = self._which("chcon", task_vars=task_vars)
         semanage_path = self._which("semanage", task_vars=task_vars)
         self._display.vvv(
@@ -837,6 +1094,7 @@ class PosixBase(ActionBase):
         perms: Optional[Dict[str, Any]] = None,
         selinux: bool = False,
         task_vars: Optional[Dict[str, Any]] = None,
+        old_stat: Optional[Dict[str, Any]] = None,
     ) -> Tuple[bool, Optional[str], List[str]]:
         """
         Compare existing file contents and permissions to desired state.
@@ -848,41 +1106,65 @@ class PosixBase(ActionBase):
         :param bool selinux: Whether SELinux attributes are in use
         :param Optional[dict] task_vars: Ansible task_vars from
             ``run()``
+        :param Optional[dict] old_stat: A ``_pseudo_stat`` result for
+            ``dest`` the caller already has, to avoid statting it again
         :returns Tuple[bool, Optional[str], List[str]]: Tuple of
             (changed, old_content, old_lines)
         :raises AnsibleActionFail: On invalid input
         """
         self._display.vvv(f"Comparing content and permissions with {dest}")
         changed = False
+        compare_perms = bool(perms and any(perms.values()))
 
-        old_stat = self._pseudo_stat(dest, task_vars=task_vars)
-        self._display.vvv(f"Old stat: {old_stat}")
+        if old_stat is None:
+            old_stat = self._pseudo_stat(
+                dest,
+                task_vars=task_vars,
+                get_perms=compare_perms,
+                selinux=selinux,
+                checksum=True,
+            )
+            self._display.vvv(f"Old stat: {old_stat}")
 
         if not old_stat["exists"]:
             self._display.vvv(f"File does not exist: {dest}")
             return True, None, []
 
-        old_slurp = self._slurp(src=dest, task_vars=task_vars)
-        old_content = old_slurp["content"]
-        old_lines = old_slurp["content_lines"]
-        self._display.vvv(f"Old lines: {old_lines}")
+        # A file whose digest matches the content _write_file would
+        # write needs no transfer; otherwise the lines are compared, as
+        # line endings may differ without the content changing
+        new_content = "\n".join(lines) + "\n"
+        old_checksum = old_stat.get("checksum")
+        if (
+            old_checksum
+            and old_checksum
+            == hashlib.sha256(new_content.encode("utf-8")).hexdigest()
+        ):
+            self._display.vvv("Content unchanged (checksum comparison)")
+            old_content = new_content
+            old_lines = list(lines)
+        else:
+            old_slurp = self._slurp(src=dest, task_vars=task_vars)
+            old_content = old_slurp["content"]
+            old_lines = old_slurp["content_lines"]
+            if self._display.verbosity >= 3:
+                self._display.vvv(f"Old lines: {old_lines}")
 
         if lines != old_lines:
             self._display.vvv("Content changed (lines comparison)")
             changed = True
 
-        old_perms = self._get_perms(dest, selinux=selinux, task_vars=task_vars)
-        self._display.vvv(f"Old perms: {old_perms}")
-
-        if perms:
-            for key in [
-                "owner",
-                "group",
-                "selevel",
-                "serole",
-                "setype",
-                "seuser",
-            ]:
+        # Only list the current permissions when there are any to
+        # compare, and reuse them when the stat probe already did
+        if compare_perms:
+            old_perms = old_stat.get("perms")
+            if old_perms is None:
+                old_perms = self._get_perms(
+                    dest, selinux=selinux, task_vars=task_vars
+                )
+            self._display.vvv(f"Old perms: {old_perms}")
+
+            for key in _PERM_COMPARE_KEYS:
                 if perms.get(key) and perms[key] != old_perms.get(key):
                     self._display.vvv(
                         f"Perm {key} changed: {perms[key]} != "
@@ -916,6 +1198,7 @@ class PosixBase(ActionBase):
         perms: Dict[str, Any],
         selinux: bool = False,
         task_vars: Optional[Dict[str, Any]] = None,
+        src: Optional[str] = None,
     ) -> None:
         """
         Apply ownership, permission mode, and SELinux context to file.
@@ -925,66 +1208,79 @@ class PosixBase(ActionBase):
         ``selinux`` is True. Then verifies the applied values match
         expectations.
 
+        When ``src`` is given, the owner, group, and mode are set on
+        it instead and it is then moved to ``dest``, all in the same
+        remote command, so ``dest`` never has the wrong permissions.
+
         :param str dest: Remote file path to update
         :param dict perms: Dictionary with keys ``owner``, ``group``,
             ``mode``, etc.
         :param bool selinux: Boolean indicating whether SELinux handling
             is enabled
         :param Optional[dict] task_vars: Ansible task variables
-        :raises AnsibleActionFail: On failure to apply or verify any
-            permission or SELinux step
+        :param Optional[str] src: Remote file to move onto ``dest``
+        :raises AnsibleActionFail: On failure to move the file or to
+            apply or verify any permission or SELinux step
         """
         self._display.vvv(f"Applying permissions to {dest}")
-        cmd = self._cmd
-
-        if perms:
-            if perms.get("owner"):
-                chown_result = cmd(
-                    ["chown", perms["owner"], dest], task_vars=task_vars
+        # Callers pass every attribute option, unset ones as None, so
+        # only the ones actually requested are applied and verified
+        perms = perms or {}
+        requested = any(perms.values())
+        sets_attrs = any(perms.get(key) for key in ("owner", "group", "mode"))
+
+        # Without SELinux nothing changes after chown, chgrp and chmod,
+        # so the same remote command also lists the result to verify
+        list_perms = requested and not selinux
+        perms_result = None
+
+        if src or list_perms or sets_attrs:
+            perms_result = self._cmd(
+                [
+                    "sh",
+                    "-c",
+                    _APPLY_PERMS_SCRIPT,
+                    "sh",
+                    perms.get("owner") or "",
+                    perms.get("group") or "",
+                    str(perms.get("mode") or ""),
+                    src or dest,
+                    "1" if list_perms else "",
+                    dest if src else "",
+                ],
+                task_vars=task_vars,
+            )
+            step = _APPLY_PERMS_FAILED_STEPS.get(perms_result["rc"])
+            if step:
+                raise AnsibleActionFail(
+                    f"Failed to {step} {src or dest}: "
+                    f"{perms_result.get('stderr', '')}"
                 )
-                if chown_result["rc"] != 0:
-                    raise AnsibleActionFail(
-                        f"Failed to chown {dest}: "
-                        f"{chown_result.get('stderr', '')}"
-                    )
-
-            if perms.get("group"):
-                chgrp_result = cmd(
-                    ["chgrp", perms["group"], dest], task_vars=task_vars
+            if perms_result["rc"] == _APPLY_PERMS_MOVE_FAILED_RC:
+                raise AnsibleActionFail(
+                    "Failed to move temp file into place: "
+                    f"{perms_result.get('stderr', '')}"
                 )
-                if chgrp_result["rc"] != 0:
-                    raise AnsibleActionFail(
-                        f"Failed to chgrp {dest}: "
-                        f"{chgrp_result.get('stderr', '')}"
-                    )
-
-            if perms.get("mode"):
-                chmod_result = cmd(
-                    ["chmod", perms["mode"], dest], task_vars=task_vars
+            if perms_result["rc"] != 0:
+                raise AnsibleActionFail(
+                    f"Could not stat {dest}: {perms_result['stderr']}"
                 )
-                if chmod_result["rc"] != 0:
-                    raise AnsibleActionFail(
-                        f"Failed to chmod {dest}: "
-                        f"{chmod_result.get('stderr', '')}"
-                    )
 
         if selinux:
             self._handle_selinux_context(dest, perms, task_vars=task_vars)
 
         # Confirm permissions were applied
-        if perms:
-            final_perms = self._get_perms(
-                dest, selinux=selinux, task_vars=task_vars
-            )
+        if requested:
+            if list_perms:
+                final_perms = self._parse_perms(
+                    perms_result["stdout_lines"][-1]
+                )
+            else:
+                final_perms = self._get_perms(
+                    dest, selinux=selinux, task_vars=task_vars
+                )
 
-            for key in [
-                "owner",
-                "group",
-                "selevel",
-                "serole",
-                "setype",
-                "seuser",
-            ]:
+            for key in _PERM_COMPARE_KEYS:
                 if perms.get(key) and final_perms.get(key) != perms.get(key):
                     raise AnsibleActionFail(
                         f"Post-apply verification failed: expected {key}="
@@ -1057,7 +1353,9 @@ class PosixBase(ActionBase):
 
         Writes content to the destination file on the remote host with
         support for optional validation, backup creation, and
-        permission handling.
+        permission handling. When the destination already matches the
+        desired content and permissions, no temporary file is staged
+        and neither validation nor backup is performed.
 
         :param Union[str, List[str]] content: A string or list of
             strings to write
@@ -1076,19 +1374,24 @@ class PosixBase(ActionBase):
         """
         self._display.vvv(f"Starting _write_file to {dest}")
 
-        cmd = self._cmd
         shell = self._connection._shell
         backup_path = None
         check_mode = check_mode or False
         result = {"changed": False}
 
-        self._make_raw_tmp_path(task_vars=task_vars)
-        tmpdir = shell.tmpdir
-        self._display.vvv(f"Using temporary directory: {tmpdir}")
-        tmpfile = shell.join_path(tmpdir, "ansible_tmpfile")
-        self._display.vvv(f"Using temporary file: {tmpfile}")
+        # Detect if any SELinux parameters are requested
+        selinux = self._check_selinux_tools(perms, task_vars=task_vars)
 
-        old_stat = self._pseudo_stat(dest, task_vars=task_vars)
+        # List the current permissions and checksum along with the stat
+        # so that the comparison below needs no extra remote call for
+        # them
+        old_stat = self._pseudo_stat(
+            dest,
+            task_vars=task_vars,
+            get_perms=bool(perms and any(perms.values())),
+            selinux=selinux,
+            checksum=True,
+        )
         self._display.vvv(f"Old stat: {old_stat}")
         if old_stat["exists"] and old_stat["type"] != "file":
             raise AnsibleActionFail(f"Cannot write over {old_stat['type']}")
@@ -1096,26 +1399,11 @@ class PosixBase(ActionBase):
         # Normalize content and lines list
         lines, content = self._normalize_content(content)
 
-        # Detect if any SELinux parameters are requested
-        selinux = self._check_selinux_tools(perms, task_vars=task_vars)
-
-        # Ensure the remote temporary directory exists
-        self._mkdir(tmpdir, task_vars=task_vars, parents=True, mode="0700")
-
-        # Write the lines to a temporary file
-        self._write_temp_file(lines, tmpfile, task_vars=task_vars)
-
-        # Run validation command, if provided
-        if validate_cmd:
-            self._validate_file(tmpfile, validate_cmd, task_vars=task_vars)
-
-        # Back up the destination file, if requested
-        if backup:
-            backup_path = self._create_backup(dest, task_vars=task_vars)
-
-        # Compare old and new
+        # Compare old and new before staging anything on the remote host
+        # so that idempotent runs skip the temp file, validation and
+        # backup entirely
         changed, old_content, old_lines = self._compare_content_and_perms(
-            dest, lines, perms, selinux, task_vars=task_vars
+            dest, lines, perms, selinux, task_vars=task_vars, old_stat=old_stat
         )
         result["changed"] = changed
 
@@ -1133,7 +1421,31 @@ class PosixBase(ActionBase):
                 "after": content,
                 "unified_diff": diff,
             }
-            self._display.vvv(f"Generated diff: {diff}")
+            if self._display.verbosity >= 3:
+                self._display.vvv(f"Generated diff: {diff}")
+
+        if result["changed"]:
+            self._make_raw_tmp_path(task_vars=task_vars)
+            tmpdir = shell.tmpdir
+            self._display.vvv(f"Using temporary directory: {tmpdir}")
+            tmpfile = shell.join_path(tmpdir, "ansible_tmpfile")
+            self._display.vvv(f"Using temporary file: {tmpfile}")
+
+            # Ensure the remote temporary directory exists
+            self._mkdir(tmpdir, task_vars=task_vars, parents=True, mode="0700")
+
+            # Write the lines to a temporary file
+            self._write_temp_file(lines, tmpfile, task_vars=task_vars)
+
+            # Run validation command, if provided
+            if validate_cmd:
+                self._validate_file(tmpfile, validate_cmd, task_vars=task_vars)
+
+            # Back up the destination file, if requested
+            if backup:
+                backup_path = self._create_backup(
+                    dest, task_vars=task_vars, dest_exists=old_stat["exists"]
+                )
 
         if check_mode:
             self._display.vvv("Check mode is enabled")
@@ -1146,18 +1458,10 @@ class PosixBase(ActionBase):
 
         else:
             if result["changed"]:
-                # Move the temp file to the final destination
-                mv_result = cmd(["mv", tmpfile, dest], task_vars=task_vars)
-                self._display.vvv(f"mv result: {mv_result}")
-                if mv_result["rc"] != 0:
-                    raise AnsibleActionFail(
-                        "Failed to move temp file into place: "
-                        f"{mv_result.get('stderr', '')}"
-                    )
-
-                # Apply final permissions and ownership
+                # Set ownership and mode on the temp file and move it to
+                # the final destination in one remote command
                 self._apply_perms_and_selinux(
-                    dest, perms, selinux, task_vars=task_vars
+                    dest, perms, selinux, task_vars=task_vars, src=tmpfile
                 )
 
                 result["msg"] = "File written successfully"
@@ -1170,7 +1474,10 @@ class PosixBase(ActionBase):
         if backup_path:
             result["backup_file"] = backup_path
 
-        self._display.vvv(f"_write_file completed: {result}")
+        # The result may hold a full before/after diff of the file, so
+        # skip formatting it unless it will actually be displayed
+        if self._display.verbosity >= 3:
+            self._display.vvv(f"_write_file completed: {result}")
         return result
 
     def _mk_dest_dir(
@@ -1199,7 +1506,9 @@ class PosixBase(ActionBase):
                 self.result["changed"] = True
             else:
                 try:
-                    self._mkdir(dir_path, task_vars=task_vars)
+                    self._mkdir(
+                        dir_path, task_vars=task_vars, target_stat=dir_stat
+                    )
                     self.result["changed"] = True
                 except Exception as e:
                     self.result.update(
@@ -34,6 +34,14 @@ options:
       - Full path to the file to read on the remote system.
     required: true
     type: str
+  return_lines:
+    description:
+      - Whether to also return the content split into O(content_lines).
+      - Disable when reading large files and only O(content) is needed, to
+        avoid holding a second copy of the content in memory.
+    type: bool
+    default: true
+    version_added: '1.5.0'
 extends_documentation_fragment:
   - action_common_attributes
   - o0_o.posix.raw_fallback
@@ -71,6 +79,11 @@ EXAMPLES = r"""
   o0_o.posix.slurp64:
     src: /etc/hostname
 
+- name: Read a large file without splitting it into lines
+  o0_o.posix.slurp64:
+    src: /var/log/messages
+    return_lines: false
+
 - name: Force raw fallback mode for debugging
   o0_o.posix.slurp64:
     src: /etc/hostname
@@ -85,7 +98,7 @@ content:
 content_lines:
   description: Content as a list of lines
   type: list
-  returned: success
+  returned: success and O(return_lines) is true
 raw:
   description: Whether the raw fallback mechanism was used.
   type: bool
@@ -104,6 +117,7 @@ def main():
     module = AnsibleModule(
         argument_spec={
             "src": {"type": "str", "required": True},
+            "return_lines": {"type": "bool", "default": True},
             "_force_raw": {"type": "bool", "default": False},
         },
         supports_check_mode=True,
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import os
 import tempfile
-from typing import Generator
+from typing import Any, Generator, List
 from unittest.mock import MagicMock
 
 import pytest
@@ -65,3 +65,23 @@ def base() -> Generator[PosixBase, None, None]:
     base._action._low_level_execute_command = real_cmd
 
     return base
+
+
+@pytest.fixture
+def cmd_calls(base) -> List[Any]:
+    """Record every command the base fixture runs through _cmd.
+
+    Wraps the real command execution of ``base`` so tests can assert
+    on how many remote calls an operation issues.
+
+    :returns List[Any]: Commands passed to ``base._cmd``, in order
+    """
+    calls = []
+    cmd = base._cmd
+
+    def recording_cmd(args, **kwargs):
+        calls.append(args)
+        return cmd(args, **kwargs)
+
+    base._cmd = recording_cmd
+    return calls
@@ -191,3 +191,61 @@ def test_apply_perms_and_selinux_confirmation(
 
     finally:
         cleanup_path(path)
+
+
+def test_apply_perms_single_command(base, cmd_calls) -> None:
+    """Test _apply_perms_and_selinux applies and verifies at once."""
+    path = generate_temp_path()
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("test")
+
+        def fail_get_perms(*args, **kwargs):
+            raise AssertionError("_get_perms should not be called")
+
+        base._get_perms = fail_get_perms
+
+        base._apply_perms_and_selinux(
+            path, {"mode": "0640"}, selinux=False, task_vars={}
+        )
+
+        assert len(cmd_calls) == 1
+        assert oct(os.stat(path).st_mode & 0o777) == "0o640"
+    finally:
+        cleanup_path(path)
+
+
+def test_apply_perms_skips_unset_perms(base) -> None:
+    """Test _apply_perms_and_selinux issues nothing for unset perms."""
+
+    def fail_cmd(*args, **kwargs):
+        raise AssertionError("_cmd should not be called")
+
+    base._cmd = fail_cmd
+
+    base._apply_perms_and_selinux(
+        "/tmp/unused",
+        {"owner": None, "group": None, "mode": None, "setype": None},
+        selinux=False,
+        task_vars={},
+    )
+
+
+def test_apply_perms_moves_src_into_place(base, cmd_calls) -> None:
+    """Test _apply_perms_and_selinux sets perms on src and moves it."""
+    src = generate_temp_path()
+    dest = generate_temp_path()
+    try:
+        with open(src, "w", encoding="utf-8") as f:
+            f.write("test")
+
+        base._apply_perms_and_selinux(
+            dest, {"mode": "0640"}, selinux=False, task_vars={}, src=src
+        )
+
+        assert len(cmd_calls) == 1
+        assert not os.path.exists(src)
+        assert oct(os.stat(dest).st_mode & 0o777) == "0o640"
+    finally:
+        cleanup_path(src)
+        cleanup_path(dest)
@@ -11,6 +11,8 @@
 
 from __future__ import annotations
 
+import hashlib
+
 import pytest
 
 from ansible.errors import AnsibleActionFail
@@ -120,7 +122,7 @@ def test_compare_content_and_perms(
     """Test _compare_content_and_perms logic."""
     dest = "/tmp/testfile"
 
-    base._pseudo_stat = lambda path, task_vars=None: old_stat
+    base._pseudo_stat = lambda path, task_vars=None, **kwargs: old_stat
     base._slurp = lambda src, task_vars=None: {
         "content": old_content,
         "content_lines": old_content.splitlines() if old_content else [],
@@ -147,3 +149,44 @@ def test_compare_content_and_perms(
         assert ret_changed is expect_change
         assert ret_content == old_content
         assert ret_lines == (old_content.splitlines() if old_content else [])
+
+
+def test_compare_content_matching_checksum_skips_slurp(base) -> None:
+    """Test _compare_content_and_perms trusts a matching checksum."""
+    content = "same\ncontent\n"
+    old_stat = {
+        "exists": True,
+        "type": "file",
+        "checksum": hashlib.sha256(content.encode("utf-8")).hexdigest(),
+    }
+
+    def fail_slurp(*args, **kwargs):
+        raise AssertionError("_slurp should not be called")
+
+    base._slurp = fail_slurp
+
+    changed, old_content, old_lines = base._compare_content_and_perms(
+        dest="/tmp/testfile",
+        lines=content.splitlines(),
+        task_vars={},
+        old_stat=old_stat,
+    )
+
+    assert changed is False
+    assert old_content == content
+    assert old_lines == content.splitlines()
+
+
+def test_compare_content_mismatched_checksum_slurps(base) -> None:
+    """Test _compare_content_and_perms compares lines on a mismatch."""
+    old_stat = {"exists": True, "type": "file", "checksum": "0" * 64}
+    base._slurp = lambda src, task_vars=None: {
+        "content": "same\r\n",
+        "content_lines": ["same"],
+    }
+
+    changed, _, _ = base._compare_content_and_perms(
+        dest="/tmp/testfile", lines=["same"], task_vars={}, old_stat=old_stat
+    )
+
+    assert changed is False
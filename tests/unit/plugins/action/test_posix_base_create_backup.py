@@ -54,6 +54,22 @@ def test_create_backup_behavior(
             assert result is None
 
 
+def test_create_backup_known_existence(base) -> None:
+    """Test _create_backup skips the existence check when told."""
+    base._cmd = MagicMock(return_value={"rc": 0})
+    base._generate_ansible_backup_path = MagicMock(
+        return_value="/tmp/testfile.txt.fakebackup"
+    )
+
+    assert base._create_backup("/tmp/testfile.txt", dest_exists=False) is None
+    base._cmd.assert_not_called()
+
+    result = base._create_backup("/tmp/testfile.txt", dest_exists=True)
+    assert result == "/tmp/testfile.txt.fakebackup"
+    assert base._cmd.call_count == 1
+    assert base._cmd.call_args[0][0][0] == "cp"
+
+
 def test_generate_ansible_backup_path_format(base) -> None:
     """Test backup path generation format."""
     path = "/etc/hosts"
@@ -61,5 +77,6 @@ def test_generate_ansible_backup_path_format(base) -> None:
 
     assert backup_path.startswith(path + ".")
     parts = backup_path.split(".")
-    assert len(parts) >= 3  # path, md5, timestamp
+    assert len(parts) >= 3  # path, digest, timestamp
+    assert len(parts[-2]) == 32
     assert parts[-1].isdigit()
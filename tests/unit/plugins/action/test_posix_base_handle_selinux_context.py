@@ -14,6 +14,9 @@ from __future__ import annotations
 import pytest
 
 from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.posix.plugins.action_utils.posix_base import (
+    _SELINUX_FCONTEXT_SCRIPT,
+)
 from ansible_collections.o0_o.posix.tests.utils import generate_temp_path
 
 
@@ -29,8 +32,7 @@ from ansible_collections.o0_o.posix.tests.utils import generate_temp_path
                 "chcon": "/usr/bin/chcon",
             },
             lambda dest: [
-                ["semanage", "fcontext", "-a", "-t", "foo_t", dest],
-                ["restorecon", dest],
+                ["sh", "-c", _SELINUX_FCONTEXT_SCRIPT, "sh", "foo_t", dest],
             ],
             None,
             None,
@@ -73,7 +75,9 @@ from ansible_collections.o0_o.posix.tests.utils import generate_temp_path
                 "restorecon": "/sbin/restorecon",
                 "chcon": "/usr/bin/chcon",
             },
-            lambda dest: [["semanage", "fcontext", "-a", "-t", "foo_t", dest]],
+            lambda dest: [
+                ["sh", "-c", _SELINUX_FCONTEXT_SCRIPT, "sh", "foo_t", dest],
+            ],
             "semanage",
             "semanage",
         ),
@@ -86,8 +90,7 @@ from ansible_collections.o0_o.posix.tests.utils import generate_temp_path
                 "chcon": "/usr/bin/chcon",
             },
             lambda dest: [
-                ["semanage", "fcontext", "-a", "-t", "foo_t", dest],
-                ["restorecon", dest],
+                ["sh", "-c", _SELINUX_FCONTEXT_SCRIPT, "sh", "foo_t", dest],
             ],
             "restorecon",
             "restorecon",
@@ -119,7 +122,14 @@ def test_handle_selinux_context_logic(
     # Mock _cmd to track and simulate execution
     def mock_cmd(cmd, task_vars=None):
         issued_cmds.append(cmd)
-        if fail_cmd and fail_cmd in cmd[0]:
+        if cmd[0] == "sh":
+            # semanage and restorecon run as one script that exits 3 or
+            # 4 depending on which of them failed
+            if fail_cmd == "semanage":
+                return {"rc": 3, "stderr": "semanage failed"}
+            if fail_cmd == "restorecon":
+                return {"rc": 4, "stderr": "restorecon failed"}
+        elif fail_cmd and fail_cmd in cmd[0]:
             return {"rc": 1, "stderr": f"{cmd[0]} failed"}
         return {"rc": 0, "stderr": ""}
 
@@ -28,6 +28,17 @@ import pytest
             },
             True,
         ),
+        # Positive: canary match is case-insensitive
+        (
+            {
+                "rc": 127,
+                "msg": (
+                    "MODULE FAILURE: the module failed to execute "
+                    "correctly, you probably need to set THE INTERPRETER"
+                ),
+            },
+            True,
+        ),
         # Negative: rc is wrong or msg doesn't match
         (
             {
@@ -40,13 +40,21 @@ def test_mk_dest_dir_behavior(
         },
     )
 
+    mkdir_calls = []
     if should_create:
-        monkeypatch.setattr(
-            base, "_mkdir", lambda p, task_vars=None: {"changed": True}
-        )
+
+        def fake_mkdir(p, task_vars=None, target_stat=None):
+            mkdir_calls.append(target_stat)
+            return {"changed": True}
+
+        monkeypatch.setattr(base, "_mkdir", fake_mkdir)
 
     base._mk_dest_dir(file_path, task_vars={})
 
+    if should_create:
+        # The parent's stat is handed on rather than repeated
+        assert mkdir_calls == [{"exists": False, "type": None}]
+
     if expect_change:
         assert base.result.get("changed") is True
     else:
@@ -66,7 +74,7 @@ def test_mk_dest_dir_mkdir_failure(monkeypatch, base) -> None:
         base, "_pseudo_stat", lambda p, task_vars=None: {"exists": False}
     )
 
-    def failing_mkdir(p, task_vars=None):
+    def failing_mkdir(p, task_vars=None, target_stat=None):
         raise OSError("simulated mkdir failure")
 
     monkeypatch.setattr(base, "_mkdir", failing_mkdir)
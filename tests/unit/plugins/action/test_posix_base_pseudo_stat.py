@@ -11,6 +11,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 
 import pytest
@@ -63,11 +64,10 @@ def test_pseudo_stat_unsupported_type(base, tmp_path) -> None:
     os.mkfifo(fifo_path)
 
     # Remove all type detection logic from this test by patching _cmd
-    # to always return rc=1 after test -e
+    # to report an existing path that matched none of the type tests
     def fake_cmd(args, task_vars=None, check_mode=None):
-        if args == ["test", "-e", str(fifo_path)]:
-            return {"rc": 0, "raw": False}
-        return {"rc": 1, "raw": False}
+        assert args[-1] == str(fifo_path)
+        return {"rc": 0, "stdout": "0 ?\n", "raw": False}
 
     base._cmd = fake_cmd
 
@@ -75,3 +75,50 @@ def test_pseudo_stat_unsupported_type(base, tmp_path) -> None:
         AnsibleActionFail, match="All POSIX 'test' commands failed"
     ):
         base._pseudo_stat(str(fifo_path))
+
+
+def test_pseudo_stat_single_command(base, cmd_calls, tmp_path) -> None:
+    """Test _pseudo_stat probes a path with a single remote command."""
+    target = tmp_path / "file"
+    target.write_text("data")
+
+    assert base._pseudo_stat(str(target))["type"] == "file"
+    assert len(cmd_calls) == 1
+
+
+def test_pseudo_stat_detects_pipe(base, tmp_path) -> None:
+    """Test _pseudo_stat detects named pipes."""
+    fifo_path = tmp_path / "fifo"
+    os.mkfifo(fifo_path)
+
+    result = base._pseudo_stat(str(fifo_path))
+
+    assert result["exists"] is True
+    assert result["type"] == "pipe"
+    assert result["is_symlink"] is False
+
+
+def test_pseudo_stat_get_perms(base, cmd_calls, tmp_path) -> None:
+    """Test _pseudo_stat lists permissions in the same remote call."""
+    target = tmp_path / "file"
+    target.write_text("data")
+    target.chmod(0o640)
+
+    result = base._pseudo_stat(str(target), get_perms=True)
+
+    assert result["type"] == "file"
+    assert result["perms"]["mode"] == "rw-r-----"
+    assert len(cmd_calls) == 1
+
+
+def test_pseudo_stat_checksum(base, tmp_path) -> None:
+    """Test _pseudo_stat reports the SHA-256 digest of a file."""
+    target = tmp_path / "file"
+    target.write_bytes(b"data\n")
+
+    result = base._pseudo_stat(str(target), get_perms=True, checksum=True)
+
+    assert result["perms"]["owner"]
+    if result["checksum"] is not None:
+        assert result["checksum"] == hashlib.sha256(b"data\n").hexdigest()
+    assert "checksum" not in base._pseudo_stat(str(tmp_path), checksum=True)
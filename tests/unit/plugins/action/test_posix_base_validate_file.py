@@ -56,3 +56,15 @@ def test_validate_file_failure_raises(monkeypatch, base) -> None:
 
     with pytest.raises(AnsibleActionFail, match="Validation failed:"):
         base._validate_file("/etc/foo", "validate %s")
+
+
+def test_validate_file_requires_placeholder(base) -> None:
+    """Test _validate_file rejects commands without a %s placeholder."""
+
+    def mock_cmd(argv, task_vars=None):
+        raise AssertionError("validation command should not run")
+
+    base._cmd = mock_cmd
+
+    with pytest.raises(AnsibleActionFail, match="validate must contain"):
+        base._validate_file("/etc/foo", "validate")
@@ -77,3 +77,41 @@ def test_which_logic(base, binary, cmd_outputs, expected_result) -> None:
     base._cmd = mock_cmd
     result = base._which(binary, task_vars={})
     assert result == expected_result
+
+
+def test_which_caches_results(base) -> None:
+    """Test PosixBase._which() resolves each binary only once."""
+    calls = []
+
+    def mock_cmd(cmd, task_vars=None):
+        calls.append(tuple(cmd))
+        if cmd[0] == "sh" and cmd[-1] == "command -v true":
+            return {"rc": 0, "stdout": "/usr/bin/true"}
+        return {"rc": 1, "stdout": ""}
+
+    base._cmd = mock_cmd
+
+    assert base._which("true", task_vars={}) == "/usr/bin/true"
+    assert base._which("true", task_vars={}) == "/usr/bin/true"
+    assert base._which("fakecmd", task_vars={}) is None
+    assert base._which("fakecmd", task_vars={}) is None
+    assert calls == [
+        ("sh", "-c", "command -v true"),
+        ("sh", "-c", "command -v fakecmd"),
+        ("which", "fakecmd"),
+    ]
+
+
+def test_which_many_single_command(base, cmd_calls) -> None:
+    """Test PosixBase._which_many() resolves binaries in one call."""
+    result = base._which_many(("sh", "echo", "o0-o-no-such-binary"))
+
+    assert result["sh"].endswith("/sh")
+    assert result["echo"] == "echo" or result["echo"].endswith("/echo")
+    assert result["o0-o-no-such-binary"] is None
+    assert len(cmd_calls) == 1
+
+    # Subsequent lookups are served from the cache
+    assert base._which("sh") == result["sh"]
+    assert base._which("o0-o-no-such-binary") is None
+    assert len(cmd_calls) == 1
@@ -62,7 +62,9 @@ def test_write_file_backup_and_validate(base) -> None:
         f.write("existing")
 
     base._validate_file = lambda tmp, cmd, task_vars: None
-    base._create_backup = lambda dest, task_vars: dest + ".bak"
+    base._create_backup = lambda dest, task_vars, dest_exists=None: (
+        dest + ".bak"
+    )
 
     # Mock _slurp to use real_cmd and cat to read the file
     def mock_slurp(src, task_vars=None):
@@ -92,6 +94,38 @@ def test_write_file_backup_and_validate(base) -> None:
     cleanup_path(tmp_path + ".bak")
 
 
+def test_write_file_unchanged_skips_staging(base) -> None:
+    """Test _write_file skips temp file, validation and backup when
+    the destination already matches."""
+    tmp_path = generate_temp_path()
+    try:
+        with open(tmp_path, "w") as f:
+            f.write("same\n")
+
+        base._slurp = lambda src, task_vars=None: {
+            "content": "same\n",
+            "content_lines": ["same"],
+        }
+        staged = []
+        base._write_temp_file = lambda *a, **kw: staged.append("write")
+        base._validate_file = lambda *a, **kw: staged.append("validate")
+        base._create_backup = lambda *a, **kw: staged.append("backup")
+
+        result = base._write_file(
+            content="same\n",
+            dest=tmp_path,
+            task_vars={},
+            validate_cmd="cat %s",
+            backup=True,
+        )
+
+        assert result["changed"] is False
+        assert "backup_file" not in result
+        assert staged == []
+    finally:
+        cleanup_path(tmp_path)
+
+
 def test_write_file_check_mode_and_diff(base) -> None:
     """Test _write_file check mode and diff functionality."""
     tmp_path = generate_temp_path()
@@ -16,6 +16,9 @@ import os
 import pytest
 
 from ansible.errors import AnsibleActionFail
+from ansible_collections.o0_o.posix.plugins.action_utils.posix_base import (
+    _WRITE_TEMP_FILE_SCRIPT,
+)
 
 
 def test_write_temp_file_success(monkeypatch, base) -> None:
@@ -24,10 +27,8 @@ def test_write_temp_file_success(monkeypatch, base) -> None:
     written = {}
 
     def mock_cmd(cmd, task_vars=None, check_mode=False, **kwargs):
-        # Expect ['tee', tmpfile] as cmd, and 'stdin' as a kwarg
-        if cmd == ["chmod", "0600", tmpfile]:
-            return {"rc": 0}
-        elif cmd == ["tee", tmpfile]:
+        # Expect a single sh -c write of tmpfile, and 'stdin' as a kwarg
+        if cmd == ["sh", "-c", _WRITE_TEMP_FILE_SCRIPT, "sh", tmpfile]:
             written["path"] = tmpfile
             written["content"] = kwargs.get("stdin")
             return {"rc": 0}
@@ -43,7 +44,7 @@ def test_write_temp_file_success(monkeypatch, base) -> None:
 
 
 def test_write_temp_file_failure(monkeypatch, base) -> None:
-    """Test _write_temp_file raises error when tee command fails."""
+    """Test _write_temp_file raises error when the write fails."""
 
     def mock_cmd(cmd, task_vars=None, check_mode=False, **kwargs):
         return {"rc": 1, "stderr": "no tee"}
@@ -54,3 +55,28 @@ def test_write_temp_file_failure(monkeypatch, base) -> None:
         AnsibleActionFail, match=r"Failed to write temp file .*no tee"
     ):
         base._write_temp_file(["oops"], "/tmp/fail", task_vars={})
+
+
+def test_write_temp_file_chmod_failure(monkeypatch, base) -> None:
+    """Test _write_temp_file reports a failed chmod separately."""
+
+    def mock_cmd(cmd, task_vars=None, check_mode=False, **kwargs):
+        return {"rc": 4, "stderr": "no chmod"}
+
+    monkeypatch.setattr(base, "_cmd", mock_cmd)
+
+    with pytest.raises(
+        AnsibleActionFail, match=r"Failed to chmod temp file: no chmod"
+    ):
+        base._write_temp_file(["oops"], "/tmp/fail", task_vars={})
+
+
+def test_write_temp_file_real(base) -> None:
+    """Test _write_temp_file writes a private file on the host."""
+    tmpfile = os.path.join(base._connection._shell.tmpdir, "real.txt")
+
+    base._write_temp_file(["one", "two"], tmpfile, task_vars={})
+
+    with open(tmpfile, encoding="utf-8") as f:
+        assert f.read().splitlines() == ["one", "two"]
+    assert oct(os.stat(tmpfile).st_mode & 0o777) == "0o600"
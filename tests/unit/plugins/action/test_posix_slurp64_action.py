@@ -0,0 +1,69 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.posix Ansible Collection.
+
+from __future__ import annotations
+
+import base64
+import binascii
+import types
+
+import pytest
+
+from ansible_collections.o0_o.posix.plugins.action import slurp64
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "hello\nworld\n",
+        "unicode: héllo wörld ✓\n",
+        "x" * 200007,
+    ],
+)
+def test_b64decode_text_roundtrip(text) -> None:
+    """Test _b64decode_text decodes content of any size."""
+    encoded = base64.b64encode(text.encode("utf-8")).decode("ascii")
+    assert slurp64._b64decode_text(encoded) == text
+
+
+def test_b64decode_text_invalid_utf8() -> None:
+    """Test _b64decode_text rejects content that is not UTF-8."""
+    encoded = base64.b64encode(b"\xff\xfe\xfd").decode("ascii")
+    with pytest.raises(UnicodeDecodeError):
+        slurp64._b64decode_text(encoded)
+
+
+def test_b64decode_text_invalid_base64() -> None:
+    """Test _b64decode_text rejects malformed base64."""
+    with pytest.raises(binascii.Error):
+        slurp64._b64decode_text("abc")
+
+
+def test_b64decode_text_uses_pybase64(monkeypatch) -> None:
+    """Test _b64decode_text decodes with pybase64 when available."""
+    calls = []
+
+    def fake_b64decode(data):
+        calls.append(data)
+        return base64.b64decode(data)
+
+    monkeypatch.setattr(
+        slurp64,
+        "pybase64",
+        types.SimpleNamespace(b64decode=fake_b64decode),
+        raising=False,
+    )
+    monkeypatch.setattr(slurp64, "HAS_PYBASE64", True)
+    encoded = base64.b64encode(b"hello\n").decode("ascii")
+
+    assert slurp64._b64decode_text(encoded) == "hello\n"
+    assert calls == [encoded]
@@ -0,0 +1,98 @@
+# vim: ts=4:sw=4:sts=4:et:ft=python
+# -*- mode: python; tab-width: 4; indent-tabs-mode: nil; -*-
+#
+# GNU General Public License v3.0+
+# SPDX-License-Identifier: GPL-3.0-or-later
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+# Copyright (c) 2025 oØ.o (@o0-o)
+#
+# This file is part of the o0_o.posix Ansible Collection.
+
+from __future__ import annotations
+
+from typing import Generator
+
+import pytest
+
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+from ansible_collections.o0_o.posix.plugins.action import template
+from ansible_collections.o0_o.posix.plugins.action.template import (
+    ActionModule,
+)
+
+
+@pytest.fixture
+def plugin(base) -> Generator[ActionModule, None, None]:
+    """Create an ActionModule instance with a real templar."""
+    base._task.async_val = False
+    base._task.action = "template"
+
+    plugin = ActionModule(
+        task=base._task,
+        connection=base._connection,
+        play_context=base._play_context,
+        loader=base._loader,
+        templar=Templar(loader=DataLoader()),
+        shared_loader_obj=base._shared_loader_obj,
+    )
+    plugin._cmd = base._cmd
+    plugin._display = base._display
+    return plugin
+
+
+@pytest.mark.parametrize(
+    "data, newline_sequence",
+    [
+        ("a\n", "\n"),
+        ("a\n\n", "\n"),
+        ("a\r\n", "\n"),
+        ("a\r\n\r\n", "\n"),
+        ("a\r", "\n"),
+        ("a\n", "\r\n"),
+        ("a\n\n\n", "\r\n"),
+    ],
+)
+def test_static_fast_path_matches_render(
+    plugin, tmp_path, data, newline_sequence
+) -> None:
+    """Test skipping the render gives the same text as rendering."""
+    src = tmp_path / "static.j2"
+    src.write_text(data, newline="")
+    overrides = dict(
+        template._DEFAULT_OVERRIDES, newline_sequence=newline_sequence
+    )
+
+    rendered = plugin._render_template(
+        data,
+        src=str(src),
+        resolved_src=str(src),
+        dest="/tmp/static.txt",
+        searchpath=[str(tmp_path)],
+        overrides=overrides,
+        task_vars={},
+    )
+
+    assert plugin._needs_render(data, overrides) or rendered == data
+
+
+@pytest.mark.parametrize(
+    "data, newline_sequence, expected",
+    [
+        ("a\n\n", "\n", False),
+        ("a\r\n\r\n", "\n", True),
+        ("a\r", "\n", True),
+        ("a\n\n\n", "\r\n", True),
+    ],
+)
+def test_needs_render_line_endings_before_2_19(
+    monkeypatch, plugin, data, newline_sequence, expected
+) -> None:
+    """Test sources with non-LF line endings are rendered pre-2.19."""
+    monkeypatch.setattr(template, "IS_ANSIBLE_2_19_PLUS", False)
+    overrides = dict(
+        template._DEFAULT_OVERRIDES, newline_sequence=newline_sequence
+    )
+
+    assert plugin._needs_render(data, overrides) is expected